@@ -1,27 +1,14 @@
 import streamlit as st
-import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
-import io
+from ppi_core import load_data, normalize_proteins, filter_interactions, render_bar, render_network, render_uniprot
 
 # ✅ Page Config
 st.set_page_config(page_title="Protein-Protein Interaction Database for Human Diseases", layout="wide")
 
-# ✅ GitHub CSV URL
-GITHUB_CSV_URL = "https://raw.githubusercontent.com/jahnaviP05/protein-protein-database/main/cleaned_interactions.csv"
-
-# ✅ Load Data Function
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv(GITHUB_CSV_URL, encoding="utf-8")
-        df.columns = df.columns.str.strip()
-        return df
-    except Exception as e:
-        st.error(f"❌ Error loading data: {e}")
-        return pd.DataFrame()
-
-df = load_data()
+df, protein_index = load_data()
+if df.empty:
+    # Nothing to show without data; drop the cached empty frame so the next rerun retries the download
+    load_data.clear()
+    st.stop()
 
 # ✅ Sidebar Navigation
 st.sidebar.title("Navigation")
@@ -51,12 +38,8 @@ elif page == "Data":
     single_protein = st.text_input("🔍 Search for a Single Protein:", "").strip()
     multi_proteins = st.text_area("🔍 Search for Multiple Proteins (comma-separated):", "").strip()
 
-    df_filtered = df
-    if single_protein:
-        df_filtered = df[(df["Protein_A"] == single_protein) | (df["Protein_B"] == single_protein)]
-    if multi_proteins:
-        protein_list = [p.strip() for p in multi_proteins.split(",")]
-        df_filtered = df[df["Protein_A"].isin(protein_list) | df["Protein_B"].isin(protein_list)]
+    proteins = normalize_proteins(single_protein, multi_proteins)
+    df_filtered = df if proteins is None else filter_interactions(df, protein_index, proteins)
 
     if df_filtered.empty:
         st.warning("⚠ No interactions found.")
@@ -72,78 +55,20 @@ elif page == "Visualization":
     search_protein = st.text_input("🔍 Search for a Single Protein:", "").strip()
     multi_proteins_input = st.text_area("🔍 Search for Multiple Proteins (comma-separated):", "").strip()
 
-    filtered_df = df
-    if search_protein:
-        filtered_df = df[(df["Protein_A"] == search_protein) | (df["Protein_B"] == search_protein)]
-    if multi_proteins_input:
-        protein_list = [p.strip() for p in multi_proteins_input.split(",")]
-        filtered_df = df[df["Protein_A"].isin(protein_list) | df["Protein_B"].isin(protein_list)]
+    # Drawing the whole dataset is never useful here, so wait for a search
+    proteins = normalize_proteins(search_protein, multi_proteins_input)
+    if proteins is None:
+        st.info("🔎 Enter at least one protein to visualize.")
+        st.stop()
+
+    filtered_df = filter_interactions(df, protein_index, proteins)
 
     if filtered_df.empty:
         st.warning("⚠ No interactions found.")
     else:
-        # ✅ Bar Chart
-        st.subheader("📊 Interaction Score Distribution")
-        filtered_df["interaction"] = filtered_df["Protein_A"] + " ↔ " + filtered_df["Protein_B"]
-        scores = filtered_df["combined_score"]
-        labels = filtered_df["interaction"]
-
-        colors = [
-            "#ff69b4" if s >= 0.9 else "#3498db" if s >= 0.7 else "#9b59b6"
-            for s in scores
-        ]
-
-        fig, ax = plt.subplots(figsize=(15, 6))
-        bars = ax.bar(labels, scores, color=colors)
-        ax.set_ylabel("Combined Score")
-        ax.set_xlabel("Protein Interactions")
-        ax.set_title("Interaction Scores by Protein Pair")
-        plt.xticks(rotation=90)
-        plt.tight_layout()
-        st.pyplot(fig)
-
-        # ✅ Network Graph
-        G = nx.Graph()
-        for _, row in filtered_df.iterrows():
-            a, b = row["Protein_A"], row["Protein_B"]
-            score = row.get("combined_score", 1)
-            distance = 1.0 / score if score > 0 else 1.0
-            G.add_edge(a, b, weight=distance, label=f"{score:.2f}")
-
-        pos = nx.spring_layout(G, weight='weight', seed=42)
-        network_buffer = io.BytesIO()
-
-        plt.figure(figsize=(14, 10))
-        nx.draw_networkx_nodes(G, pos, node_size=600, node_color="#1f78b4")
-        nx.draw_networkx_edges(G, pos, edge_color="#999999", width=2)
-        nx.draw_networkx_labels(G, pos, font_color="black", font_size=10)
-        edge_labels = nx.get_edge_attributes(G, 'label')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=8)
-
-        plt.savefig(network_buffer, format="png")
-        network_buffer.seek(0)
-        st.image(network_buffer)
-
-        # ✅ UniProt Details Page (Styled with Search)
-        st.subheader("🔗 Protein Details")
-        search_term = st.text_input("🔍 Search UniProt Details by Protein Name:")
-
-        all_proteins = sorted(set(filtered_df["Protein_A"]).union(filtered_df["Protein_B"]))
-        if search_term:
-            matching_proteins = [p for p in all_proteins if search_term.lower() in p.lower()]
-        else:
-            matching_proteins = all_proteins
-
-        st.markdown("<div style='background-color:#f1f3f6; padding:10px; border-radius:10px;'>", unsafe_allow_html=True)
-
-        if matching_proteins:
-            for protein in matching_proteins:
-                uniprot_url = f"https://www.uniprot.org/uniprotkb/?query={protein}&sort=score"
-                st.markdown(f"✩ UniProt: [**{protein}**]({uniprot_url})", unsafe_allow_html=True)
-        else:
-            st.info("🔎 No matching proteins found.")
-
-        st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown("---")
-        st.markdown("💡 *Note: This opens the UniProt search page for the selected protein.*")
+        # A one-protein search selects only that protein's edges, so the network is a star around it
+        center = next(iter(proteins)) if len(proteins) == 1 else None
+
+        render_bar(filtered_df)
+        render_network(filtered_df, center)
+        render_uniprot(filtered_df)
@@ -0,0 +1,194 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import networkx as nx
+from matplotlib.figure import Figure
+import io
+import os
+import time
+
+# ✅ GitHub CSV URL
+GITHUB_CSV_URL = "https://raw.githubusercontent.com/jahnaviP05/protein-protein-database/main/cleaned_interactions.csv"
+
+# ✅ Local Parquet copy of the CSV, next to this file (re-downloaded at server start when older than a day)
+PARQUET_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cleaned_interactions.parquet")
+PARQUET_MAX_AGE = 24 * 60 * 60
+
+# ✅ Refresh Function (a failed download keeps whatever local copy is already there)
+def refresh_parquet():
+    if os.path.exists(PARQUET_CACHE_PATH) and time.time() - os.path.getmtime(PARQUET_CACHE_PATH) <= PARQUET_MAX_AGE:
+        return
+    try:
+        raw = pd.read_csv(GITHUB_CSV_URL, encoding="utf-8")
+        raw.columns = raw.columns.str.strip()
+        tmp_path = PARQUET_CACHE_PATH + ".tmp"
+        raw.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, PARQUET_CACHE_PATH)
+    except Exception as e:
+        if not os.path.exists(PARQUET_CACHE_PATH):
+            raise
+        st.warning(f"⚠ Couldn't refresh data, using the local copy: {e}")
+
+# ✅ Load Data Function
+@st.cache_resource
+def load_data():
+    try:
+        refresh_parquet()
+        df = pd.read_parquet(PARQUET_CACHE_PATH)
+        # Shared categories make protein lookups integer-code comparisons
+        proteins = pd.concat([df["Protein_A"], df["Protein_B"]]).dropna().unique()
+        protein_dtype = pd.CategoricalDtype(proteins)
+        df["Protein_A"] = df["Protein_A"].astype(protein_dtype)
+        df["Protein_B"] = df["Protein_B"].astype(protein_dtype)
+        # The index holds row positions, so it's built and cached together with its frame
+        return df, build_protein_index(df)
+    except Exception as e:
+        st.error(f"❌ Error loading data: {e}")
+        return pd.DataFrame(), {}
+
+# ✅ Protein Index Function (protein -> row positions in df)
+def build_protein_index(df):
+    codes = np.concatenate([df["Protein_A"].cat.codes.to_numpy(), df["Protein_B"].cat.codes.to_numpy()])
+    rows = np.tile(np.arange(len(df), dtype=np.int32), 2)
+    found = codes >= 0
+    codes, rows = codes[found], rows[found]
+    proteins = df["Protein_A"].cat.categories
+    counts = np.bincount(codes, minlength=len(proteins))
+    groups = np.split(rows[np.argsort(codes, kind="stable")], np.cumsum(counts)[:-1])
+    return dict(zip(proteins, groups))
+
+# ✅ Filter Function (rows where either partner is in the protein list; index comes from load_data with df)
+def filter_interactions(df, index, proteins):
+    hits = [index[p] for p in proteins if p in index]
+    if not hits:
+        return df.iloc[:0]
+    return df.iloc[np.unique(np.concatenate(hits))]
+
+# ✅ Star Layout (single-protein search: the query at the origin, its partners evenly on the unit circle)
+def star_layout(G, center):
+    neighbors = [node for node in G if node != center]
+    angles = 2 * np.pi * np.arange(len(neighbors)) / max(len(neighbors), 1)
+    pos = {center: np.zeros(2)}
+    pos.update(zip(neighbors, np.column_stack([np.cos(angles), np.sin(angles)])))
+    return pos
+
+# ✅ Network Graph + Layout Function (cached per edge set; edges is the hashable key)
+# Shared by every session, so only the most recent queries are kept.
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_graph_and_layout(edges, _edges_df, center=None, seed=42):
+    G = nx.from_pandas_edgelist(_edges_df, "Protein_A", "Protein_B", edge_attr=["weight", "label"])
+    if center is not None:
+        return G, star_layout(G, center)
+    # The numba / scipy layout stack is only loaded once a network actually needs it
+    from ppi_layout import lbfgs_layout
+    return G, lbfgs_layout(G, weight="weight", seed=seed)
+
+# ✅ Large Network Render Function (datashader rasterizes edges and nodes in compiled code)
+LARGE_NETWORK_EDGES = 500
+
+def render_network_image(G, pos, width=1400, height=1000):
+    import datashader as ds
+    import datashader.transfer_functions as tf
+
+    nodes = pd.DataFrame.from_dict(pos, orient="index", columns=["x", "y"])
+    ends = list(G.edges())
+    segments = pd.DataFrame(
+        np.hstack([nodes.loc[[u for u, _ in ends]].to_numpy(), nodes.loc[[v for _, v in ends]].to_numpy()]),
+        columns=["x0", "y0", "x1", "y1"],
+    )
+    canvas = ds.Canvas(plot_width=width, plot_height=height, x_range=(-1.1, 1.1), y_range=(-1.1, 1.1))
+    edge_img = tf.shade(canvas.line(segments, x=["x0", "x1"], y=["y0", "y1"], axis=1, agg=ds.count()), cmap=["#cccccc", "#555555"])
+    node_img = tf.spread(tf.shade(canvas.points(nodes, "x", "y", agg=ds.count()), cmap=["#1f78b4"]), px=3)
+    return tf.set_background(tf.stack(edge_img, node_img), "white").to_pil()
+
+# ✅ Figure Function (one reusable Figure per chart and session, cleared before each draw)
+def get_figure(name, figsize):
+    key = f"figure_{name}"
+    if key not in st.session_state:
+        fig = Figure(figsize=figsize)
+        st.session_state[key] = (fig, fig.add_subplot())
+    fig, ax = st.session_state[key]
+    ax.clear()
+    return fig, ax
+
+# ✅ Search Normalization (multi-protein search takes precedence over the single-protein box)
+# Order, spacing and repeats don't change the result, so they're dropped here.
+def normalize_proteins(single_protein, multi_proteins):
+    if multi_proteins:
+        return frozenset(p.strip() for p in multi_proteins.split(",") if p.strip())
+    if single_protein:
+        return frozenset([single_protein])
+    return None
+
+# ✅ Bar Chart Render Function
+def render_bar(filtered_df):
+    st.subheader("📊 Interaction Score Distribution")
+    scores = filtered_df["combined_score"]
+    labels = np.char.add(np.char.add(filtered_df["Protein_A"].to_numpy(str), " ↔ "), filtered_df["Protein_B"].to_numpy(str))
+
+    scores_arr = scores.to_numpy()
+    colors = np.select([scores_arr >= 0.9, scores_arr >= 0.7], ["#ff69b4", "#3498db"], default="#9b59b6")
+
+    fig, ax = get_figure("scores", (15, 6))
+    bars = ax.bar(labels, scores, color=colors)
+    ax.set_ylabel("Combined Score")
+    ax.set_xlabel("Protein Interactions")
+    ax.set_title("Interaction Scores by Protein Pair")
+    ax.tick_params(axis="x", labelrotation=90)
+    fig.tight_layout()
+    st.pyplot(fig)
+
+# ✅ Network Graph Render Function (center: the searched protein when every edge touches it)
+def render_network(filtered_df, center=None):
+    # Labels and the cache key keep the float64 scores the bar chart and table show
+    scores = filtered_df["combined_score"].fillna(1.0).to_numpy()
+    s = scores.astype(np.float32)
+    edges_df = filtered_df.assign(
+        weight=np.where(s > 0, 1.0 / np.maximum(s, 1e-9), 1.0),
+        label=[f"{x:.2f}" for x in scores],
+    )
+    edges = tuple(sorted(zip(edges_df["Protein_A"], edges_df["Protein_B"], scores)))
+    G, pos = build_graph_and_layout(edges, edges_df, center)
+    network_buffer = io.BytesIO()
+
+    if G.number_of_edges() > LARGE_NETWORK_EDGES:
+        render_network_image(G, pos).save(network_buffer, format="png")
+    else:
+        net_fig, net_ax = get_figure("network", (14, 10))
+        nx.draw_networkx_nodes(G, pos, node_size=600, node_color="#1f78b4", ax=net_ax)
+        nx.draw_networkx_edges(G, pos, edge_color="#999999", width=2, ax=net_ax)
+        nx.draw_networkx_labels(G, pos, font_color="black", font_size=10, ax=net_ax)
+        edge_labels = nx.get_edge_attributes(G, 'label')
+        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, font_size=8, ax=net_ax)
+
+        net_fig.savefig(network_buffer, format="jpeg", dpi=100, pil_kwargs={"quality": 85})
+    network_buffer.seek(0)
+    st.image(network_buffer)
+
+# ✅ UniProt Details Render Function (Styled with Search)
+def render_uniprot(filtered_df):
+    st.subheader("🔗 Protein Details")
+    search_term = st.text_input("🔍 Search UniProt Details by Protein Name:")
+
+    # unique() first: Index.union keeps repeated labels; sort=True because equal inputs come back unsorted
+    all_proteins = pd.Index(np.asarray(filtered_df["Protein_A"].unique())).union(np.asarray(filtered_df["Protein_B"].unique()), sort=True)
+    if search_term:
+        matching_proteins = all_proteins[all_proteins.str.contains(search_term, case=False, regex=False)]
+    else:
+        matching_proteins = all_proteins
+
+    st.markdown("<div style='background-color:#f1f3f6; padding:10px; border-radius:10px;'>", unsafe_allow_html=True)
+
+    if len(matching_proteins):
+        links = "\n\n".join(
+            f"✩ UniProt: [**{protein}**](https://www.uniprot.org/uniprotkb/?query={protein}&sort=score)"
+            for protein in matching_proteins
+        )
+        st.markdown(links, unsafe_allow_html=True)
+    else:
+        st.info("🔎 No matching proteins found.")
+
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("💡 *Note: This opens the UniProt search page for the selected protein.*")
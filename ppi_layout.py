@@ -0,0 +1,180 @@
+import numpy as np
+import networkx as nx
+from scipy.optimize import minimize
+import numba
+from numba import njit, prange, get_num_threads
+import threading
+
+# ✅ Threading Layer (pinned to workqueue before the first parallel call: with TBB, a kernel
+# run from a session thread leaves the process unable to exit)
+numba.config.THREADING_LAYER = "workqueue"
+
+# ✅ Repulsion Kernel Lock (sessions run in their own threads, and numba's workqueue
+# threading layer aborts the whole process on concurrent parallel calls)
+REPULSION_LOCK = threading.Lock()
+
+# ✅ Exact Repulsion Kernel (nodes split into one mini-batch per thread, batches run in parallel)
+# Coordinates come in as separate float32 xs / ys arrays; the j loop is cut into tiles of
+# `tile` nodes so each tile stays in L1 while the whole batch sweeps over it.
+# Returns Σ ln d and Σ (x_i - x_j)/d² per node, the same terms as barnes_hut_repulsion.
+# Call it with REPULSION_LOCK held.
+@njit(parallel=True, fastmath=True, cache=True)
+def repulsion_kernel(xs, ys, batch_size, tile=64):
+    n = xs.shape[0]
+    log_sum = np.zeros(n)
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    n_batches = (n + batch_size - 1) // batch_size
+    for b in prange(n_batches):
+        lo, hi = b * batch_size, min((b + 1) * batch_size, n)
+        for start in range(0, n, tile):
+            stop = min(start + tile, n)
+            for i in range(lo, hi):
+                xi, yi = xs[i], ys[i]
+                acc, ax, ay = np.float32(0), np.float32(0), np.float32(0)
+                for j in range(start, stop):
+                    if j == i:
+                        continue
+                    dx, dy = xi - xs[j], yi - ys[j]
+                    d2 = max(dx * dx + dy * dy, np.float32(1e-12))
+                    acc += np.float32(0.5) * np.log(d2)
+                    ax += dx / d2
+                    ay += dy / d2
+                log_sum[i] += acc
+                fx[i] += ax
+                fy[i] += ay
+    return log_sum, fx, fy
+
+# ✅ Attraction Kernel (Σ w·d³ over edges and its gradient d·w·(x_i - x_j), per coordinate)
+@njit(fastmath=True, cache=True)
+def attraction_kernel(xs, ys, src, dst, w):
+    n = xs.shape[0]
+    energy = 0.0
+    gx = np.zeros(n)
+    gy = np.zeros(n)
+    for e in range(src.shape[0]):
+        i, j = src[e], dst[e]
+        dx, dy = xs[i] - xs[j], ys[i] - ys[j]
+        d = np.sqrt(dx * dx + dy * dy)
+        energy += w[e] * d * d * d
+        s = w[e] * d
+        gx[i] += s * dx
+        gy[i] += s * dy
+        gx[j] -= s * dx
+        gy[j] -= s * dy
+    return energy, gx, gy
+
+# ✅ Barnes-Hut Repulsion (quadtree walked level by level for all nodes at once)
+# Returns Σ m·ln d and Σ m·(x_i - c)/d² per node, where each far cell acts as its
+# mass m at its centre of mass c and nodes only see near cells down to the leaves.
+def barnes_hut_repulsion(pos, theta=1.2, max_depth=None):
+    n = len(pos)
+    depth = max_depth or min(int(np.ceil(np.log2(n))) + 1, 16)
+    lo = pos.min(axis=0)
+    extent = max(float(np.ptp(pos, axis=0).max()), 1e-9) * (1 + 1e-9)
+    grid = np.minimum(((pos - lo) / extent * (1 << depth)).astype(np.int64), (1 << depth) - 1)
+
+    # Per level: node -> cell, cell mass / centre of mass, and each cell's children
+    # Cells are keyed in Z-order, so each cell's children are contiguous after sorting
+    node_cell, mass, com, child_start, child_count = [], [], [], [], []
+    keys = np.zeros(n, dtype=np.int64)
+    for level in range(depth + 1):
+        if level:
+            bits = (grid >> (depth - level)) & 1
+            keys = (keys << 2) | (bits[:, 0] << 1) | bits[:, 1]
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        m = np.bincount(inverse, minlength=len(uniq)).astype(float)
+        c = np.column_stack([np.bincount(inverse, pos[:, i], minlength=len(uniq)) for i in range(2)]) / m[:, None]
+        node_cell.append(inverse)
+        mass.append(m)
+        com.append(c)
+        if level:
+            parent = node_cell[level - 1][np.unique(inverse, return_index=True)[1]]
+            counts = np.bincount(parent, minlength=len(mass[level - 1]))
+            child_count.append(counts)
+            child_start.append(np.concatenate([[0], np.cumsum(counts)[:-1]]))
+
+    log_sum = np.zeros(n)
+    force = np.zeros((n, 2))
+    nodes = np.arange(n)
+    cells = np.zeros(n, dtype=np.intp)
+    for level in range(depth + 1):
+        m = mass[level][cells]
+        c = com[level][cells]
+        own = node_cell[level][nodes] == cells
+        if level == depth:
+            # Leaf cells: drop the node itself from its own cell's mass
+            c = np.where(own[:, None], (m[:, None] * c - pos[nodes]) / np.maximum(m - 1, 1)[:, None], c)
+            m = np.where(own, m - 1, m)
+            accept = m > 0
+        else:
+            diff = pos[nodes] - c
+            dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+            accept = ~own & (extent / (1 << level) < theta * dist)
+
+        diff = pos[nodes[accept]] - c[accept]
+        d2 = np.maximum(np.einsum("ij,ij->i", diff, diff), 1e-12)
+        hit = nodes[accept]
+        log_sum += np.bincount(hit, 0.5 * m[accept] * np.log(d2), minlength=n)
+        push = (m[accept] / d2)[:, None] * diff
+        force += np.column_stack([np.bincount(hit, push[:, i], minlength=n) for i in range(2)])
+
+        if level == depth:
+            break
+        nodes, cells = nodes[~accept], cells[~accept]
+        counts = child_count[level][cells]
+        starts = np.repeat(child_start[level][cells], counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        nodes = np.repeat(nodes, counts)
+        cells = starts + offsets
+    return log_sum, force
+
+# ✅ Force-Directed Layout (Fruchterman-Reingold energy minimized with L-BFGS)
+def lbfgs_layout(G, weight="weight", seed=42, gravity=0.1, max_iter=300, ftol=1e-5,
+                 theta=1.2, barnes_hut_threshold=2000):
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    node_id = {node: i for i, node in enumerate(nodes)}
+    edge_list = [(node_id[u], node_id[v], d.get(weight, 1.0)) for u, v, d in G.edges(data=True) if u != v]
+    src = np.fromiter((e[0] for e in edge_list), dtype=np.int32, count=len(edge_list))
+    dst = np.fromiter((e[1] for e in edge_list), dtype=np.int32, count=len(edge_list))
+    w = np.fromiter((e[2] for e in edge_list), dtype=np.float32, count=len(edge_list))
+    k = 1.0 / np.sqrt(n)
+    batch_size = -(-n // get_num_threads())
+
+    # FR forces as gradients: attraction d²/k from w·d³/3k, repulsion k²/d from -k²·ln d,
+    # plus a weak pull to the centroid so disconnected components stay on screen.
+    # The optimizer vector is laid out as [xs..., ys...] so the kernels read contiguous arrays.
+    def energy_and_grad(flat):
+        xs = flat[:n].astype(np.float32)
+        ys = flat[n:].astype(np.float32)
+
+        pull_energy, gx, gy = attraction_kernel(xs, ys, src, dst, w)
+        energy = pull_energy / (3 * k)
+        gx /= k
+        gy /= k
+
+        if n > barnes_hut_threshold:
+            log_sum, push = barnes_hut_repulsion(flat.reshape(2, n).T, theta)
+            push_x, push_y = push[:, 0], push[:, 1]
+        else:
+            with REPULSION_LOCK:
+                log_sum, push_x, push_y = repulsion_kernel(xs, ys, batch_size)
+        energy -= 0.5 * k * k * log_sum.sum()
+        gx -= k * k * push_x
+        gy -= k * k * push_y
+
+        centered = flat.reshape(2, n) - flat.reshape(2, n).mean(axis=1, keepdims=True)
+        energy += 0.5 * gravity * (centered ** 2).sum()
+        return energy, np.concatenate([gx, gy]) + gravity * centered.ravel()
+
+    rng = np.random.default_rng(seed)
+    x0 = rng.random(2 * n)
+    result = minimize(energy_and_grad, x0, jac=True, method="L-BFGS-B", options={"maxiter": max_iter, "ftol": ftol})
+    pos = nx.rescale_layout(result.x.reshape(2, n).T)
+    return dict(zip(nodes, pos))
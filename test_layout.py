@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from ppi_layout import barnes_hut_repulsion, repulsion_kernel
+
+# ✅ Exact repulsion sums for the same points, as the float32 kernel sees them
+def exact_repulsion(pos):
+    log_sum, fx, fy = repulsion_kernel(pos[:, 0].astype(np.float32), pos[:, 1].astype(np.float32), 256)
+    return log_sum, np.column_stack([fx, fy])
+
+def force_error(force, exact):
+    return np.linalg.norm(force - exact, axis=1) / np.linalg.norm(exact, axis=1)
+
+class BarnesHutRepulsionTest(unittest.TestCase):
+    def setUp(self):
+        self.pos = np.random.default_rng(0).random((3000, 2))
+        self.exact_log_sum, self.exact_force = exact_repulsion(self.pos)
+
+    def test_zero_theta_opens_every_cell(self):
+        log_sum, force = barnes_hut_repulsion(self.pos, theta=0.0)
+        np.testing.assert_allclose(log_sum, self.exact_log_sum, rtol=1e-5)
+        self.assertLess(force_error(force, self.exact_force).max(), 1e-3)
+
+    def test_default_theta_stays_close_to_exact(self):
+        log_sum, force = barnes_hut_repulsion(self.pos, theta=1.2)
+        np.testing.assert_allclose(log_sum, self.exact_log_sum, rtol=1e-2)
+        errors = force_error(force, self.exact_force)
+        self.assertLess(np.median(errors), 0.03)
+        self.assertLess(np.percentile(errors, 95), 0.1)
+
+if __name__ == "__main__":
+    unittest.main()